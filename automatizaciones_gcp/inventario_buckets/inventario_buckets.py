@@ -40,4 +40,5 @@ def listar_buckets():
 
 
 # Ejecutar la función
-listar_buckets()
+if __name__ == "__main__":
+    listar_buckets()
@@ -1,4 +1,5 @@
 import re
+import ast
 import pendulum
 from google.oauth2 import service_account
 from google.cloud.orchestration.airflow import service_v1
@@ -52,11 +53,58 @@ def get_dag_details(dag_file_content):
     return dag_name, description, start_date, schedule, dag_state, tasks
 
 
+# Patrones de tablas en el SQL embebido en los DAGs
+TABLE_REF = r'`?([\w.:-]+\.[\w-]+)`?(?![\w.:-])'
+SQL_STATEMENT = re.compile(
+    r'\b(?:SELECT|INSERT|UPDATE|DELETE|MERGE|CREATE|TRUNCATE)\b', re.IGNORECASE)
+SQL_EXTRACT = re.compile(r'\bEXTRACT\s*\([^)]*\)', re.IGNORECASE)
+SQL_READ = re.compile(r'\b(DELETE\s+)?(?:FROM|JOIN|USING)\s+' + TABLE_REF, re.IGNORECASE)
+SQL_WRITE = re.compile(
+    r'\b(?:INSERT\s+INTO|DELETE\s+FROM|CREATE\s+(?:OR\s+REPLACE\s+)?TABLE|TRUNCATE\s+TABLE)\s+'
+    + TABLE_REF, re.IGNORECASE)
+SQL_UPDATE = re.compile(r'\bUPDATE\s+' + TABLE_REF + r'(?:\s+(?:AS\s+)?\w+)?\s+SET\b', re.IGNORECASE)
+SQL_MERGE = re.compile(
+    r'\bMERGE(?:\s+INTO)?\s+' + TABLE_REF + r'(?:\s+(?:AS\s+)?\w+)?\s+USING\b', re.IGNORECASE)
+DESTINATION_ARG = re.compile(r'destination_(?:project_)?(?:dataset_)?table')
+
+
+def get_dag_tables(dag_file_content):
+    # Solo se analizan los strings del DAG (como inv_python.extract_tables),
+    # así los comentarios y los "from modulo import ..." no se toman como tablas
+    try:
+        tree = ast.parse(dag_file_content)
+    except SyntaxError as e:
+        print(f"Error al analizar el DAG para extraer tablas: {e}")
+        return [], []
+
+    read_tables = set()
+    write_tables = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.keyword) and node.arg and DESTINATION_ARG.fullmatch(node.arg):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                write_tables.add(node.value.value)
+        if not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+            continue
+        if not SQL_STATEMENT.search(node.value):
+            continue
+
+        # EXTRACT(YEAR FROM columna) no es una tabla
+        sql = SQL_EXTRACT.sub(' ', node.value)
+        # Los DELETE FROM son escrituras, no lecturas
+        read_tables.update(table for delete, table in SQL_READ.findall(sql) if not delete)
+        write_tables.update(SQL_WRITE.findall(sql))
+        write_tables.update(SQL_UPDATE.findall(sql))
+        write_tables.update(SQL_MERGE.findall(sql))
+
+    return sorted(read_tables), sorted(write_tables)
+
+
 def process_dag_file(blob):
     if blob.name.endswith('.py'):
         dag_file_content = blob.download_as_text()
         dag_name, description, start_date, schedule, dag_state, tasks = get_dag_details(
             dag_file_content)
+        read_tables, write_tables = get_dag_tables(dag_file_content)
         return {
             'archivo_dag': blob.name,
             'nombre_dag': dag_name,
@@ -64,7 +112,9 @@ def process_dag_file(blob):
             'fecha_inicio': start_date,
             'schedule': schedule,
             'estado_dag': dag_state,
-            'tareas': tasks
+            'tareas': tasks,
+            'tablas_lectura': ', '.join(read_tables),
+            'tablas_escritura': ', '.join(write_tables)
         }
     return None
 
@@ -113,6 +163,8 @@ def create_dag_inventory(project_id, location, output_file):
                 'schedule': dag['schedule'],
                 'estado_dag': dag['estado_dag'],
                 'tareas': dag['tareas'],
+                'tablas_lectura': dag['tablas_lectura'],
+                'tablas_escritura': dag['tablas_escritura'],
                 'ubicacion': location,
                 'version_airflow': version_airflow
             })
@@ -120,7 +172,7 @@ def create_dag_inventory(project_id, location, output_file):
     df = pd.DataFrame(dag_inventory)
     df.columns = ['nombre_entorno', 'prefijo_gcs_dag', 'archivo_dag', 'nombre_dag',
                   'descripcion', 'fecha_inicio', 'schedule', 'estado_dag', 'tareas',
-                  'ubicacion', 'version_airflow']
+                  'tablas_lectura', 'tablas_escritura', 'ubicacion', 'version_airflow']
 
     df.to_csv(output_file, index=False, sep=';')
     print(f"Inventario de DAGs guardado en {output_file}")
@@ -0,0 +1,382 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import functools
+import platform
+import tempfile
+import statistics
+import tracemalloc
+import traceback
+import contextlib
+import importlib.util
+from datetime import datetime
+from types import SimpleNamespace
+
+import generadores
+import simuladores
+
+RAIZ_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROYECTO = "proyecto-benchmark"
+UBICACION = "us-central1"
+
+# Tamaño base de cada corpus; --escala los multiplica
+TAMANOS_BASE = {
+    "pentaho": 200,
+    "python": 50,
+    "dags": 100,
+    "entornos": 2,
+    "funciones": 500,
+    "ofertas": 30,
+}
+
+
+def cargar_modulo(ruta_relativa):
+    """
+    Carga un script del repositorio como módulo nuevo, sin depender de sys.path.
+
+    Args:
+        ruta_relativa (str): Ruta del script respecto a la raíz del repositorio.
+
+    Returns:
+        module: Módulo cargado.
+    """
+    ruta = os.path.join(RAIZ_REPO, ruta_relativa)
+    nombre = "bench_" + os.path.splitext(os.path.basename(ruta))[0]
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def generar_corpus(directorio, escala, semilla):
+    """
+    Genera todos los corpus sintéticos bajo un mismo directorio.
+
+    Args:
+        directorio (str): Directorio de destino.
+        escala (float): Multiplicador sobre TAMANOS_BASE.
+        semilla (int): Semilla para reproducibilidad.
+
+    Returns:
+        SimpleNamespace: Rutas y tamaños de cada corpus.
+    """
+    tamanos = {clave: max(1, int(valor * escala)) for clave, valor in TAMANOS_BASE.items()}
+    corpus = SimpleNamespace(tamanos=tamanos, buckets={}, prefijos_dags=[], directorios_dags=[])
+
+    corpus.pentaho = os.path.join(directorio, "pentaho")
+    generadores.generar_arbol_pentaho(corpus.pentaho, tamanos["pentaho"], semilla=semilla)
+
+    corpus.python = os.path.join(directorio, "python")
+    generadores.generar_modulos_python(corpus.python, tamanos["python"], semilla=semilla)
+
+    # Un bucket de DAGs por entorno de Composer, repartiendo los DAGs entre ellos
+    for entorno in range(tamanos["entornos"]):
+        nombre_bucket = f"bucket-composer-{entorno}"
+        corpus.buckets[nombre_bucket] = os.path.join(directorio, "gcs", nombre_bucket)
+        corpus.prefijos_dags.append(f"gs://{nombre_bucket}/dags")
+        corpus.directorios_dags.append(os.path.join(corpus.buckets[nombre_bucket], "dags"))
+        generadores.generar_dags(
+            corpus.directorios_dags[-1],
+            max(1, tamanos["dags"] // tamanos["entornos"]), semilla=semilla + entorno)
+
+    # Bucket de datos adicional para que listar_buckets recorra un volumen mayor
+    corpus.buckets["bucket-datos"] = corpus.pentaho
+
+    corpus.ofertas = os.path.join(directorio, "ofertas")
+    generadores.generar_paginas_ofertas(
+        os.path.join(corpus.ofertas, "listadoOfertas"), tamanos["ofertas"], semilla=semilla)
+
+    corpus.entornos = simuladores.generar_entornos_composer(PROYECTO, UBICACION, corpus.prefijos_dags)
+    corpus.funciones_v1 = simuladores.generar_funciones_v1(
+        PROYECTO, UBICACION, tamanos["funciones"], semilla=semilla)
+    corpus.funciones_v2 = simuladores.generar_funciones_v2(
+        PROYECTO, UBICACION, tamanos["funciones"], semilla=semilla)
+    return corpus
+
+
+def _contar_archivos(directorio, extensiones=None):
+    return sum(
+        1 for _, _, files in os.walk(directorio) for file in files
+        if extensiones is None or file.endswith(extensiones))
+
+
+def contar_corpus(corpus):
+    """
+    Cuenta los elementos del corpus que efectivamente quedaron en disco y en memoria.
+
+    Args:
+        corpus (SimpleNamespace): Corpus devuelto por generar_corpus.
+
+    Returns:
+        dict: Cantidad de elementos por corpus.
+    """
+    return {
+        "pentaho": _contar_archivos(corpus.pentaho, (".kjb", ".ktr")),
+        "python": _contar_archivos(corpus.python, ".py"),
+        "dags": sum(_contar_archivos(directorio, ".py") for directorio in corpus.directorios_dags),
+        "entornos": len(corpus.entornos),
+        "funciones_v1": len(corpus.funciones_v1),
+        "funciones_v2": len(corpus.funciones_v2),
+        "ofertas": _contar_archivos(os.path.join(corpus.ofertas, "listadoOfertas")),
+    }
+
+
+# Cada benchmark recibe el contexto de ejecución (corpus, directorio de trabajo
+# y URL del portal simulado) y devuelve una función sin argumentos que ejecuta
+# el punto de entrada y retorna la cantidad de elementos procesados.
+
+
+def bench_crear_inventario_kjb(ctx):
+    modulo = cargar_modulo("inventario_etl_pentaho/script_inventario_pentaho.py")
+    salida = os.path.join(ctx.trabajo, "inventario_jobs.csv")
+
+    def ejecutar():
+        modulo.crear_inventario_kjb(ctx.corpus.pentaho, salida)
+        with open(salida, "r") as archivo:
+            return sum(1 for _ in archivo) - 1
+    return ejecutar
+
+
+def bench_inventory_python_files(ctx):
+    modulo = cargar_modulo("inv_python.py")
+    return lambda: len(modulo.inventory_python_files(ctx.corpus.python))
+
+
+def bench_list_dags_in_gcs(ctx):
+    modulo = cargar_modulo("automatizaciones_gcp/inventario_dags/inventario_dags.py")
+    return lambda: sum(len(modulo.list_dags_in_gcs(prefijo)) for prefijo in ctx.corpus.prefijos_dags)
+
+
+def bench_create_dag_inventory(ctx):
+    modulo = cargar_modulo("automatizaciones_gcp/inventario_dags/inventario_dags.py")
+    salida = os.path.join(ctx.trabajo, "inventario_dags.csv")
+
+    def ejecutar():
+        modulo.create_dag_inventory(PROYECTO, UBICACION, salida)
+        with open(salida, "r", encoding="utf-8") as archivo:
+            return sum(1 for _ in archivo) - 1
+    return ejecutar
+
+
+def bench_list_functions_v1(ctx):
+    modulo = cargar_modulo("automatizaciones_gcp/inventario_funciones/inventario_cloud_func.py")
+    return lambda: len(modulo.list_functions_v1(PROYECTO, UBICACION))
+
+
+def bench_list_functions_v2(ctx):
+    modulo = cargar_modulo("automatizaciones_gcp/inventario_funciones/inventario_cloud_func.py")
+    return lambda: len(modulo.list_functions_v2(PROYECTO, UBICACION))
+
+
+def bench_listar_buckets(ctx):
+    modulo = cargar_modulo("automatizaciones_gcp/inventario_buckets/inventario_buckets.py")
+
+    def ejecutar():
+        modulo.listar_buckets()
+        # listar_buckets escribe en el directorio actual, que es el de trabajo
+        with open("inventario_buckets.csv", "r", encoding="utf-8") as archivo:
+            return sum(1 for _ in archivo) - 1
+    return ejecutar
+
+
+def bench_scrape_listado_ofertas(ctx):
+    modulo = cargar_modulo("webscrapper/web_scrapper.py")
+    # Se omite el delay de cortesía entre solicitudes; la latencia la inyecta el servidor local
+    modulo.time = SimpleNamespace(sleep=lambda segundos: None)
+    base_url = f"{ctx.url_ofertas}/listadoOfertas"
+    return lambda: len(modulo.scrape_listado_ofertas(base_url, max_ids=ctx.corpus.tamanos["ofertas"]))
+
+
+BENCHMARKS = {
+    "crear_inventario_kjb": bench_crear_inventario_kjb,
+    "inventory_python_files": bench_inventory_python_files,
+    "list_dags_in_gcs": bench_list_dags_in_gcs,
+    "create_dag_inventory": bench_create_dag_inventory,
+    "list_functions_v1": bench_list_functions_v1,
+    "list_functions_v2": bench_list_functions_v2,
+    "listar_buckets": bench_listar_buckets,
+    "scrape_listado_ofertas": bench_scrape_listado_ofertas,
+}
+
+
+def medir(preparar, repeticiones):
+    """
+    Mide tiempo y memoria pico de un benchmark.
+
+    El tiempo se toma sin tracemalloc (que agrega sobrecarga); la memoria pico
+    se mide en una ejecución adicional con tracemalloc activo.
+
+    Args:
+        preparar (callable): Devuelve la función a medir; se invoca dentro
+            de la medición para que los errores de importación queden reportados.
+        repeticiones (int): Número de ejecuciones cronometradas.
+
+    Returns:
+        dict: Métricas del benchmark.
+    """
+    try:
+        ejecutar = preparar()
+        tiempos = []
+        elementos = 0
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            elementos = ejecutar()
+            tiempos.append(time.perf_counter() - inicio)
+
+        tracemalloc.start()
+        try:
+            ejecutar()
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return {
+            "estado": "error",
+            "error": f"{type(e).__name__}: {e}",
+            "traza": traceback.format_exc(),
+        }
+
+    mediana = statistics.median(tiempos)
+    return {
+        "estado": "ok",
+        "elementos": elementos,
+        "repeticiones": repeticiones,
+        "segundos": tiempos,
+        "segundos_min": min(tiempos),
+        "segundos_mediana": mediana,
+        "elementos_por_segundo": elementos / mediana if mediana > 0 else None,
+        "memoria_pico_mb": round(pico / (1024 * 1024), 3),
+    }
+
+
+def ejecutar_benchmarks(nombres, escala=1.0, latencia=0.0, repeticiones=3, semilla=0, directorio=None):
+    """
+    Genera los corpus, instala los simuladores y ejecuta los benchmarks indicados.
+
+    Args:
+        nombres (list): Benchmarks a ejecutar (claves de BENCHMARKS).
+        escala (float, optional): Multiplicador del tamaño de los corpus.
+        latencia (float, optional): Segundos inyectados por llamada simulada
+            (en el listado de GCS, por página de 1000 objetos).
+        repeticiones (int, optional): Ejecuciones cronometradas por benchmark.
+        semilla (int, optional): Semilla de los generadores.
+        directorio (str, optional): Directorio donde conservar los corpus. Sus
+            subdirectorios corpus y trabajo se vacían antes de generar.
+
+    Returns:
+        dict: Reporte con el entorno, los parámetros y los resultados.
+    """
+    temporal = None
+    if directorio is None:
+        temporal = directorio = tempfile.mkdtemp(prefix="bench_inventarios_")
+    directorio = os.path.abspath(directorio)
+
+    # Restos de corridas anteriores alterarían los tamaños medidos
+    for subdirectorio in ("corpus", "trabajo"):
+        shutil.rmtree(os.path.join(directorio, subdirectorio), ignore_errors=True)
+
+    cwd_original = os.getcwd()
+    try:
+        inicio = time.perf_counter()
+        corpus = generar_corpus(os.path.join(directorio, "corpus"), escala, semilla)
+        segundos_generacion = time.perf_counter() - inicio
+        tamanos_corpus = contar_corpus(corpus)
+
+        # Los scripts escriben CSV y logs en el directorio actual
+        trabajo = os.path.join(directorio, "trabajo")
+        os.makedirs(trabajo, exist_ok=True)
+        os.chdir(trabajo)
+
+        resultados = []
+        with contextlib.ExitStack() as pila:
+            pila.enter_context(simuladores.simuladores_gcp(
+                buckets=corpus.buckets, entornos=corpus.entornos,
+                funciones_v1=corpus.funciones_v1, funciones_v2=corpus.funciones_v2,
+                latencia=latencia))
+            url_ofertas = pila.enter_context(simuladores.servidor_ofertas(corpus.ofertas, latencia))
+            ctx = SimpleNamespace(corpus=corpus, trabajo=trabajo, url_ofertas=url_ofertas)
+
+            for nombre in nombres:
+                print(f"Ejecutando {nombre}...")
+                resultado = medir(functools.partial(BENCHMARKS[nombre], ctx), repeticiones)
+                resultados.append({"nombre": nombre, **resultado})
+    finally:
+        os.chdir(cwd_original)
+        if temporal is not None:
+            shutil.rmtree(temporal, ignore_errors=True)
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "parametros": {
+            "escala": escala,
+            "latencia_segundos": latencia,
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+        },
+        "corpus": {**tamanos_corpus, "segundos_generacion": segundos_generacion},
+        "resultados": resultados,
+    }
+
+
+def imprimir_resumen(reporte):
+    print(f"{'Benchmark':<26}{'Elementos':>10}{'Mediana (s)':>13}{'Elem/s':>12}{'Pico (MB)':>11}")
+    for resultado in reporte["resultados"]:
+        if resultado["estado"] != "ok":
+            print(f"{resultado['nombre']:<26} ERROR {resultado['error']}")
+            continue
+        por_segundo = resultado["elementos_por_segundo"]
+        print(f"{resultado['nombre']:<26}{resultado['elementos']:>10}"
+              f"{resultado['segundos_mediana']:>13.4f}"
+              f"{(por_segundo or 0):>12.1f}{resultado['memoria_pico_mb']:>11.2f}")
+
+
+def _entero_positivo(valor):
+    numero = int(valor)
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"debe ser un entero mayor o igual a 1: {valor}")
+    return numero
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks de los scripts de inventario con corpus sintéticos y simuladores locales.")
+    parser.add_argument("--escala", type=float, default=1.0,
+                        help="Multiplicador del tamaño de los corpus (por defecto 1.0).")
+    parser.add_argument("--latencia-ms", type=float, default=0.0,
+                        help="Latencia inyectada por llamada a las APIs simuladas, en milisegundos.")
+    parser.add_argument("--repeticiones", type=_entero_positivo, default=3,
+                        help="Ejecuciones cronometradas por benchmark.")
+    parser.add_argument("--semilla", type=int, default=0,
+                        help="Semilla de los generadores de corpus.")
+    parser.add_argument("--solo", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help="Benchmarks a ejecutar (por defecto todos).")
+    parser.add_argument("--directorio",
+                        help="Directorio donde generar y conservar los corpus (por defecto uno temporal).")
+    parser.add_argument("--salida", default="reporte_benchmarks.json",
+                        help="Archivo JSON del reporte.")
+    args = parser.parse_args(argv)
+
+    reporte = ejecutar_benchmarks(
+        args.solo, escala=args.escala, latencia=args.latencia_ms / 1000,
+        repeticiones=args.repeticiones, semilla=args.semilla, directorio=args.directorio)
+
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(reporte, archivo, ensure_ascii=False, indent=2)
+
+    imprimir_resumen(reporte)
+    print(f"Reporte guardado en {args.salida}")
+    return 0 if all(r["estado"] == "ok" for r in reporte["resultados"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import os
+import random
+
+# Nombres base para construir corpus sintéticos reproducibles
+DATASETS = ["ventas", "finanzas", "clientes", "logistica", "marketing", "rrhh"]
+TABLAS = ["pedidos", "facturas", "usuarios", "productos", "envios",
+          "campanias", "empleados", "pagos", "inventario", "sucursales"]
+EMPRESAS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark"]
+UBICACIONES = ["Santiago", "Valparaíso", "Concepción", "Temuco", "Antofagasta"]
+
+
+def _tabla_aleatoria(rng):
+    return f"{rng.choice(DATASETS)}.{rng.choice(TABLAS)}_{rng.randint(1, 500)}"
+
+
+def generar_arbol_pentaho(destino, cantidad, profundidad=4, pasos_por_archivo=20, semilla=0):
+    """
+    Genera un árbol anidado de archivos .kjb/.ktr con contenido XML sintético.
+
+    Args:
+        destino (str): Directorio donde se crea el árbol.
+        cantidad (int): Número total de archivos a generar.
+        profundidad (int, optional): Niveles máximos de subdirectorios.
+        pasos_por_archivo (int, optional): Pasos (step/entry) por archivo.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        int: Número de archivos generados.
+    """
+    rng = random.Random(semilla)
+    for indice in range(cantidad):
+        niveles = [f"nivel_{rng.randint(0, 5)}" for _ in range(rng.randint(1, profundidad))]
+        directorio = os.path.join(destino, *niveles)
+        os.makedirs(directorio, exist_ok=True)
+
+        extension = ".kjb" if indice % 2 == 0 else ".ktr"
+        raiz = "job" if extension == ".kjb" else "transformation"
+        pasos = []
+        for paso in range(pasos_por_archivo):
+            pasos.append(
+                f"    <step>\n"
+                f"      <name>paso_{paso}</name>\n"
+                f"      <database>conexion_{rng.choice(DATASETS)}</database>\n"
+                f"      <tableName>{_tabla_aleatoria(rng)}</tableName>\n"
+                f"      <sourceUri>gs://bucket-{rng.choice(DATASETS)}/entrada/{paso}.csv</sourceUri>\n"
+                f"    </step>\n")
+
+        with open(os.path.join(directorio, f"proceso_{indice}{extension}"), "w", encoding="utf-8") as archivo:
+            archivo.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<{raiz}>\n')
+            archivo.write(f"  <name>proceso_{indice}</name>\n")
+            archivo.write(f"  <filename>proceso_{indice}{extension}</filename>\n")
+            archivo.write("  <steps>\n" + "".join(pasos) + "  </steps>\n")
+            archivo.write(f"</{raiz}>\n")
+
+    return cantidad
+
+
+def generar_modulos_python(destino, cantidad, consultas_por_modulo=200, semilla=0):
+    """
+    Genera módulos Python extensos con consultas SQL embebidas en strings.
+
+    Args:
+        destino (str): Directorio donde se crean los módulos.
+        cantidad (int): Número de módulos a generar.
+        consultas_por_modulo (int, optional): Funciones con SQL por módulo.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        int: Número de módulos generados.
+    """
+    rng = random.Random(semilla)
+    for indice in range(cantidad):
+        directorio = os.path.join(destino, rng.choice(DATASETS))
+        os.makedirs(directorio, exist_ok=True)
+
+        lineas = [
+            "import sys",
+            "from google.cloud import bigquery",
+            "",
+            f"project_id = 'proyecto-{rng.choice(DATASETS)}'",
+            "config = {'host': 'localhost', 'database': "
+            f"'db_{rng.choice(DATASETS)}', 'user': 'etl'}}",
+            "",
+        ]
+        for consulta in range(consultas_por_modulo):
+            lineas += [
+                f"def consulta_{consulta}(cliente):",
+                f'    sql = """SELECT id, nombre, monto FROM {_tabla_aleatoria(rng)} '
+                f'WHERE fecha >= \'2024-01-01\' AND estado = {consulta}"""',
+                "    return cliente.query(sql).result()",
+                "",
+            ]
+
+        with open(os.path.join(directorio, f"modulo_{indice}.py"), "w", encoding="utf-8") as archivo:
+            archivo.write("\n".join(lineas))
+
+    return cantidad
+
+
+def generar_dags(destino, cantidad, tareas_por_dag=15, semilla=0):
+    """
+    Genera archivos de DAGs de Airflow con el formato que reconoce get_dag_details.
+
+    Args:
+        destino (str): Directorio donde se crean los DAGs.
+        cantidad (int): Número de DAGs a generar.
+        tareas_por_dag (int, optional): Tareas encadenadas por DAG.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        int: Número de DAGs generados.
+    """
+    rng = random.Random(semilla)
+    os.makedirs(destino, exist_ok=True)
+    for indice in range(cantidad):
+        tareas = [f"tarea_{indice}_{tarea}" for tarea in range(tareas_por_dag)]
+        lineas = [
+            "import airflow",
+            "from datetime import datetime",
+            "from airflow.operators.bash import BashOperator",
+            "",
+            "with airflow.DAG(",
+            f"    'dag_{indice}',",
+            f"    tags=['{rng.choice(DATASETS)}', 'sintetico'],",
+            f"    start_date=datetime(2024, {rng.randint(1, 12)}, {rng.randint(1, 28)}),",
+            f"    schedule_interval='{rng.choice(['@daily', '@hourly', '0 3 * * *'])}',",
+            ") as dag:",
+        ]
+        for tarea in tareas:
+            lineas.append(
+                f"    {tarea} = BashOperator(task_id='{tarea}', "
+                f"bash_command='bq query \"SELECT * FROM {_tabla_aleatoria(rng)}\"')")
+        lineas += ["", "    # Set task dependencies", "    " + " >> ".join(tareas), ""]
+
+        with open(os.path.join(destino, f"dag_{indice}.py"), "w", encoding="utf-8") as archivo:
+            archivo.write("\n".join(lineas))
+
+    return cantidad
+
+
+def generar_paginas_ofertas(destino, cantidad, parrafos_por_oferta=10, semilla=0):
+    """
+    Genera páginas HTML de ofertas guardadas, nombradas por ID como en listadoOfertas.
+
+    Args:
+        destino (str): Directorio donde se guardan las páginas.
+        cantidad (int): Número de páginas a generar.
+        parrafos_por_oferta (int, optional): Párrafos de la descripción.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        int: Número de páginas generadas.
+    """
+    rng = random.Random(semilla)
+    os.makedirs(destino, exist_ok=True)
+    for oferta_id in range(cantidad):
+        parrafos = "".join(
+            f"<p>Experiencia con {rng.choice(['Python', 'SQL', 'Airflow', 'GCP', 'Pentaho'])} "
+            f"y modelos de datos en {rng.choice(DATASETS)}.</p>"
+            for _ in range(parrafos_por_oferta))
+        html = (
+            "<html><head><title>Oferta</title></head><body>"
+            "<nav>" + "".join(f"<a href='/{i}'>Oferta {i}</a>" for i in range(20)) + "</nav>"
+            "<div class='detalleOfertaContainer'>"
+            f"<h1>Ingeniero de Datos {oferta_id}</h1>"
+            f"<a class='empresa' href='#'>{rng.choice(EMPRESAS)}</a>"
+            f"<span class='ubicacion'>{rng.choice(UBICACIONES)}</span>"
+            f"<div class='descripcion'>{parrafos}</div>"
+            "</div></body></html>")
+
+        with open(os.path.join(destino, str(oferta_id)), "w", encoding="utf-8") as archivo:
+            archivo.write(html)
+
+    return cantidad
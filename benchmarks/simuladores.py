@@ -0,0 +1,306 @@
+import os
+import sys
+import time
+import random
+import datetime
+import functools
+import threading
+import contextlib
+from types import ModuleType, SimpleNamespace
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# Módulos de Google Cloud que se reemplazan por los simuladores locales
+MODULOS_GOOGLE = [
+    "google", "google.oauth2", "google.oauth2.service_account",
+    "google.cloud", "google.cloud.storage",
+    "google.cloud.orchestration", "google.cloud.orchestration.airflow",
+    "google.cloud.orchestration.airflow.service_v1",
+    "google.cloud.functions_v1", "google.cloud.functions_v2",
+]
+
+# Tamaño de página del listado de objetos de GCS
+BLOBS_POR_PAGINA = 1000
+
+
+def _esperar(latencia):
+    if latencia > 0:
+        time.sleep(latencia)
+
+
+# Simulador de Google Cloud Storage respaldado por directorios locales
+
+
+class BlobLocal:
+    def __init__(self, name, ruta, latencia):
+        self.name = name
+        self.ruta = ruta
+        self.latencia = latencia
+        estado = os.stat(ruta)
+        self.size = estado.st_size
+        self.time_created = datetime.datetime.fromtimestamp(estado.st_mtime)
+
+    def download_as_text(self, encoding="utf-8"):
+        _esperar(self.latencia)
+        with open(self.ruta, "r", encoding=encoding) as archivo:
+            return archivo.read()
+
+
+class BucketLocal:
+    def __init__(self, name, directorio, latencia):
+        self.name = name
+        self.directorio = directorio
+        self.latencia = latencia
+
+    def list_blobs(self, prefix=None):
+        # Una latencia por cada página de BLOBS_POR_PAGINA objetos, como en la API real
+        entregados = 0
+        for root, _, files in os.walk(self.directorio):
+            for file in sorted(files):
+                ruta = os.path.join(root, file)
+                nombre = os.path.relpath(ruta, self.directorio).replace(os.sep, "/")
+                if prefix is None or nombre.startswith(prefix):
+                    if entregados % BLOBS_POR_PAGINA == 0:
+                        _esperar(self.latencia)
+                    entregados += 1
+                    yield BlobLocal(nombre, ruta, self.latencia)
+        if entregados == 0:
+            _esperar(self.latencia)
+
+
+class ClienteStorageLocal:
+    def __init__(self, buckets, latencia, project=None, credentials=None):
+        self.buckets = buckets
+        self.latencia = latencia
+        self.project = project
+
+    def bucket(self, bucket_name):
+        return BucketLocal(bucket_name, self.buckets[bucket_name], self.latencia)
+
+    def list_buckets(self):
+        _esperar(self.latencia)
+        for nombre in sorted(self.buckets):
+            yield self.bucket(nombre)
+
+
+# Simulador de la API de Composer
+
+
+class ClienteComposerLocal:
+    def __init__(self, entornos, latencia, credentials=None):
+        self.entornos = {entorno.name: entorno for entorno in entornos}
+        self.latencia = latencia
+
+    def list_environments(self, parent):
+        _esperar(self.latencia)
+        return [entorno for nombre, entorno in self.entornos.items() if nombre.startswith(parent)]
+
+    def get_environment(self, name):
+        _esperar(self.latencia)
+        return self.entornos[name]
+
+
+def generar_entornos_composer(proyecto, ubicacion, prefijos_dags):
+    """
+    Construye entornos de Composer sintéticos, uno por prefijo GCS de DAGs.
+
+    Args:
+        proyecto (str): ID del proyecto.
+        ubicacion (str): Ubicación de los entornos.
+        prefijos_dags (list): Prefijos gs:// donde viven los DAGs.
+
+    Returns:
+        list: Entornos con la forma que devuelve la API de Composer.
+    """
+    return [
+        SimpleNamespace(
+            name=f"projects/{proyecto}/locations/{ubicacion}/environments/entorno-{indice}",
+            config=SimpleNamespace(
+                dag_gcs_prefix=prefijo,
+                software_config=SimpleNamespace(image_version="composer-2.9.7-airflow-2.9.3")))
+        for indice, prefijo in enumerate(prefijos_dags)
+    ]
+
+
+# Simuladores de la API de Cloud Functions
+
+
+class ClienteFunctionsV1Local:
+    def __init__(self, funciones, latencia):
+        self.funciones = funciones
+        self.latencia = latencia
+
+    def list_functions(self, request):
+        _esperar(self.latencia)
+        return SimpleNamespace(functions=self.funciones)
+
+
+class ClienteFunctionsV2Local:
+    def __init__(self, funciones, latencia):
+        self.funciones = funciones
+        self.latencia = latencia
+
+    def list_functions(self, parent):
+        _esperar(self.latencia)
+        return iter(self.funciones)
+
+
+def _variables_entorno(rng, cantidad):
+    claves = ["DATASET", "TABLA", "DB_HOST", "API_TOKEN", "PROYECTO", "SECRET_KEY", "REGION"]
+    return {f"{rng.choice(claves)}_{i}": f"valor_{rng.randint(0, 1000)}" for i in range(cantidad)}
+
+
+def generar_funciones_v1(proyecto, ubicacion, cantidad, variables_por_funcion=20, semilla=0):
+    """
+    Construye funciones de primera generación sintéticas.
+
+    Args:
+        proyecto (str): ID del proyecto.
+        ubicacion (str): Ubicación de las funciones.
+        cantidad (int): Número de funciones.
+        variables_por_funcion (int, optional): Variables de entorno por función.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        list: Funciones con la forma que devuelve functions_v1.
+    """
+    rng = random.Random(semilla)
+    funciones = []
+    for indice in range(cantidad):
+        marca = SimpleNamespace(seconds=1_700_000_000 + indice, nanos=rng.randint(0, 999_999_999))
+        https = indice % 2 == 0
+        funciones.append(SimpleNamespace(
+            name=f"projects/{proyecto}/locations/{ubicacion}/functions/funcion-v1-{indice}",
+            description=f"Función sintética {indice}",
+            status=rng.randint(0, 5),
+            entry_point="main",
+            runtime="python311",
+            timeout=SimpleNamespace(seconds=60),
+            environment_variables=_variables_entorno(rng, variables_por_funcion),
+            max_instances=rng.choice([0, 10, 100]),
+            update_time=marca,
+            create_time=marca,
+            https_trigger=SimpleNamespace(url=f"https://{ubicacion}-{proyecto}.cloudfunctions.net/f{indice}") if https else None,
+            event_trigger=None if https else SimpleNamespace(
+                event_type="google.storage.object.finalize",
+                resource=f"projects/_/buckets/storage.googleapis.com/bucket-{indice}"),
+        ))
+    return funciones
+
+
+def generar_funciones_v2(proyecto, ubicacion, cantidad, variables_por_funcion=20, semilla=0):
+    """
+    Construye funciones de segunda generación sintéticas.
+
+    Args:
+        proyecto (str): ID del proyecto.
+        ubicacion (str): Ubicación de las funciones.
+        cantidad (int): Número de funciones.
+        variables_por_funcion (int, optional): Variables de entorno por función.
+        semilla (int, optional): Semilla para reproducibilidad.
+
+    Returns:
+        list: Funciones con la forma que devuelve functions_v2.
+    """
+    rng = random.Random(semilla)
+    funciones = []
+    for indice in range(cantidad):
+        marca = datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=indice)
+        funciones.append(SimpleNamespace(
+            name=f"projects/{proyecto}/locations/{ubicacion}/functions/funcion-v2-{indice}",
+            description=f"Función sintética {indice}",
+            state=SimpleNamespace(name=rng.choice(["ACTIVE", "DEPLOYING", "FAILED"])),
+            build_config=SimpleNamespace(entry_point="main", runtime="python312"),
+            service_config=SimpleNamespace(
+                environment_variables=_variables_entorno(rng, variables_por_funcion),
+                timeout_seconds=540,
+                max_instance_count=rng.choice([0, 10, 100])),
+            event_trigger=SimpleNamespace(
+                event_type="google.cloud.storage.object.v1.finalized",
+                trigger=f"projects/{proyecto}/triggers/storage.googleapis.com/bucket-{indice}"),
+            update_time=marca,
+            create_time=marca,
+        ))
+    return funciones
+
+
+@contextlib.contextmanager
+def simuladores_gcp(buckets=None, entornos=None, funciones_v1=None, funciones_v2=None, latencia=0.0):
+    """
+    Instala temporalmente los módulos de Google Cloud simulados en sys.modules.
+
+    Los scripts de inventario importados dentro del bloque usan los clientes
+    locales en lugar de las APIs reales.
+
+    Args:
+        buckets (dict, optional): Nombre de bucket -> directorio local.
+        entornos (list, optional): Entornos de Composer.
+        funciones_v1 (list, optional): Funciones de primera generación.
+        funciones_v2 (list, optional): Funciones de segunda generación.
+        latencia (float, optional): Segundos de espera por llamada a la API.
+    """
+    modulos = {nombre: ModuleType(nombre) for nombre in MODULOS_GOOGLE}
+
+    modulos["google.oauth2.service_account"].Credentials = SimpleNamespace(
+        from_service_account_file=lambda ruta: SimpleNamespace(ruta=ruta))
+    modulos["google.cloud.storage"].Client = functools.partial(
+        ClienteStorageLocal, buckets or {}, latencia)
+    modulos["google.cloud.orchestration.airflow.service_v1"].EnvironmentsClient = functools.partial(
+        ClienteComposerLocal, entornos or [], latencia)
+    modulos["google.cloud.functions_v1"].CloudFunctionsServiceClient = functools.partial(
+        ClienteFunctionsV1Local, funciones_v1 or [], latencia)
+    modulos["google.cloud.functions_v1"].ListFunctionsRequest = SimpleNamespace
+    modulos["google.cloud.functions_v2"].FunctionServiceClient = functools.partial(
+        ClienteFunctionsV2Local, funciones_v2 or [], latencia)
+
+    # Enlazar cada submódulo como atributo de su paquete padre
+    for nombre, modulo in modulos.items():
+        padre, _, hijo = nombre.rpartition(".")
+        if padre:
+            setattr(modulos[padre], hijo, modulo)
+
+    originales = {nombre: sys.modules.get(nombre) for nombre in MODULOS_GOOGLE}
+    sys.modules.update(modulos)
+    try:
+        yield modulos
+    finally:
+        for nombre, original in originales.items():
+            if original is None:
+                sys.modules.pop(nombre, None)
+            else:
+                sys.modules[nombre] = original
+
+
+# Simulador del portal de ofertas: sirve las páginas HTML guardadas por HTTP
+
+
+@contextlib.contextmanager
+def servidor_ofertas(directorio, latencia=0.0):
+    """
+    Levanta un servidor HTTP local que sirve las páginas de ofertas guardadas.
+
+    Args:
+        directorio (str): Directorio cuyo contenido se publica.
+        latencia (float, optional): Segundos de espera por solicitud.
+
+    Yields:
+        str: URL base del servidor (http://127.0.0.1:<puerto>).
+    """
+    class Manejador(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=directorio, **kwargs)
+
+        def do_GET(self):
+            _esperar(latencia)
+            super().do_GET()
+
+        def log_message(self, format, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), Manejador)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    try:
+        yield f"http://127.0.0.1:{servidor.server_address[1]}"
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
@@ -0,0 +1,441 @@
+import os
+import csv
+import sys
+import time
+import sqlite3
+import hashlib
+import argparse
+from datetime import datetime
+
+# Valores que los inventarios usan cuando no encontraron tablas
+VALORES_VACIOS = {"", "desconocido", "n/a", "nan", "none"}
+
+# Se incrementa cuando cambia el esquema; el índice se reconstruye recargando los CSV
+VERSION_ESQUEMA = 1
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS artefactos (
+    id INTEGER PRIMARY KEY,
+    origen TEXT NOT NULL,
+    ruta TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    maquina TEXT NOT NULL DEFAULT '',
+    detalle TEXT,
+    huella TEXT NOT NULL,
+    actualizado TEXT NOT NULL,
+    UNIQUE (ruta, origen, maquina)
+);
+CREATE INDEX IF NOT EXISTS idx_artefactos_nombre ON artefactos (nombre);
+
+CREATE TABLE IF NOT EXISTS referencias (
+    artefacto_id INTEGER NOT NULL REFERENCES artefactos (id) ON DELETE CASCADE,
+    nombre_normalizado TEXT NOT NULL,
+    proyecto TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    tabla TEXT NOT NULL,
+    operacion TEXT NOT NULL,
+    PRIMARY KEY (artefacto_id, nombre_normalizado, operacion)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_referencias_tabla ON referencias (tabla, dataset, proyecto);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS artefactos_fts USING fts5 (nombre, ruta, detalle, tablas);
+"""
+
+
+def normalizar_tabla(nombre_tabla, proyecto_defecto=""):
+    """
+    Normaliza una referencia a tabla a sus componentes proyecto, dataset y tabla.
+
+    Acepta las variantes que aparecen en los inventarios: comillas o backticks,
+    mayúsculas, y la notación heredada de BigQuery "proyecto:dataset.tabla".
+
+    Args:
+        nombre_tabla (str): Referencia tal como aparece en el inventario.
+        proyecto_defecto (str, optional): Proyecto a usar si la referencia no lo incluye.
+
+    Returns:
+        tuple: (nombre_normalizado, proyecto, dataset, tabla) o None si la referencia está vacía.
+    """
+    limpio = nombre_tabla.strip().strip("`\"'[]();,").lower()
+    for caracter in "`\"[]":
+        limpio = limpio.replace(caracter, "")
+    if limpio in VALORES_VACIOS:
+        return None
+
+    partes = limpio.replace(":", ".").split(".")
+    tabla = partes[-1]
+    dataset = partes[-2] if len(partes) >= 2 else ""
+    proyecto = ".".join(partes[:-2]) if len(partes) >= 3 else ""
+    if not proyecto and dataset:
+        proyecto = proyecto_defecto.strip().lower()
+
+    nombre_normalizado = ".".join(parte for parte in (proyecto, dataset, tabla) if parte)
+    return nombre_normalizado, proyecto, dataset, tabla
+
+
+def _separar(valor):
+    return [parte.strip() for parte in (valor or "").split(",") if parte.strip()]
+
+
+def abrir_indice(ruta_indice):
+    """
+    Abre (o crea) el índice de linaje SQLite.
+
+    Args:
+        ruta_indice (str): Ruta al archivo SQLite.
+
+    Returns:
+        sqlite3.Connection: Conexión con el esquema creado.
+
+    Raises:
+        sqlite3.DatabaseError: Si el archivo tiene una tabla artefactos con otra
+            versión de esquema; hay que reconstruir el índice en un archivo nuevo.
+    """
+    conexion = sqlite3.connect(ruta_indice)
+    conexion.execute("PRAGMA journal_mode = WAL")
+    conexion.execute("PRAGMA synchronous = NORMAL")
+    conexion.execute("PRAGMA foreign_keys = ON")
+
+    version = conexion.execute("PRAGMA user_version").fetchone()[0]
+    existe = conexion.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artefactos'").fetchone()
+    if existe and version != VERSION_ESQUEMA:
+        conexion.close()
+        raise sqlite3.DatabaseError(
+            f"{ruta_indice} no es un índice de linaje con la versión de esquema {VERSION_ESQUEMA} "
+            f"(tiene la versión {version}); reconstruya el índice en un archivo nuevo recargando los inventarios")
+
+    conexion.executescript(ESQUEMA)
+    conexion.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+    return conexion
+
+
+# Lectores de los CSV de cada inventario. Cada uno produce artefactos con la
+# forma {'ruta', 'nombre', 'maquina', 'detalle', 'proyecto', 'tablas'}, donde
+# 'tablas' es una lista de (referencia, operacion).
+
+
+def _filas_csv(archivo_csv, encoding, columnas, **opciones):
+    """
+    Recorre las filas de un CSV de inventario, validando antes su encabezado.
+
+    Args:
+        archivo_csv (str): Ruta al CSV.
+        encoding (str): Codificación del CSV.
+        columnas (list): Columnas que el lector necesita.
+        **opciones: Argumentos adicionales para csv.DictReader.
+
+    Raises:
+        ValueError: Si al CSV le faltan columnas (por ejemplo, es de otro inventario).
+    """
+    with open(archivo_csv, "r", newline="", encoding=encoding, errors="replace") as archivo:
+        lector = csv.DictReader(archivo, **opciones)
+        encabezado = [columna.strip() for columna in lector.fieldnames or []]
+        faltantes = [columna for columna in columnas if columna not in encabezado]
+        if faltantes:
+            raise ValueError(f"{archivo_csv} no tiene las columnas {', '.join(faltantes)}")
+        for fila in lector:
+            yield {clave.strip(): (valor or "").strip() for clave, valor in fila.items() if clave}
+
+
+def leer_inventario_pentaho(archivo_csv, encoding="utf-8"):
+    """Lee el CSV generado por crear_inventario_kjb."""
+    columnas = ["Nombre", "Ruta", "Maquina", "Tablas_Relacionadas"]
+    for fila in _filas_csv(archivo_csv, encoding, columnas, skipinitialspace=True):
+        yield {
+            "ruta": os.path.join(fila["Ruta"], fila["Nombre"]),
+            "nombre": fila["Nombre"],
+            "maquina": fila["Maquina"],
+            "detalle": " ".join([fila.get("Base de datos", ""), fila.get("Source", "")]),
+            "proyecto": "",
+            # El XML de Pentaho no distingue lectura de escritura
+            "tablas": [(tabla, "desconocida") for tabla in _separar(fila["Tablas_Relacionadas"])],
+        }
+
+
+def leer_inventario_python(archivo_csv, encoding="utf-8"):
+    """Lee el CSV generado por inv_python.save_to_csv."""
+    columnas = ["file_name", "file_path", "tables"]
+    for fila in _filas_csv(archivo_csv, encoding, columnas):
+        yield {
+            "ruta": fila["file_path"],
+            "nombre": fila["file_name"],
+            "maquina": "",
+            "detalle": " ".join([fila.get("function", ""), fila.get("database", "")]),
+            "proyecto": fila.get("bigquery_project", ""),
+            # extract_tables solo reconoce tablas después de FROM
+            "tablas": [(tabla, "lectura") for tabla in _separar(fila["tables"])],
+        }
+
+
+def leer_inventario_dags(archivo_csv, encoding="utf-8"):
+    """Lee el CSV generado por create_dag_inventory."""
+    columnas = ["prefijo_gcs_dag", "archivo_dag", "nombre_dag", "tablas_lectura", "tablas_escritura"]
+    for fila in _filas_csv(archivo_csv, encoding, columnas, delimiter=";"):
+        bucket = fila["prefijo_gcs_dag"].replace("gs://", "").split("/", 1)[0]
+        yield {
+            "ruta": f"gs://{bucket}/{fila['archivo_dag']}",
+            "nombre": fila["nombre_dag"],
+            "maquina": fila.get("nombre_entorno", ""),
+            "detalle": " ".join([fila.get("descripcion", ""), fila.get("tareas", "")]),
+            "proyecto": "",
+            "tablas": [(tabla, "lectura") for tabla in _separar(fila["tablas_lectura"])]
+            + [(tabla, "escritura") for tabla in _separar(fila["tablas_escritura"])],
+        }
+
+
+LECTORES = {
+    "pentaho": leer_inventario_pentaho,
+    "python": leer_inventario_python,
+    "dags": leer_inventario_dags,
+}
+
+
+def registrar_artefactos(conexion, origen, artefactos, podar=False):
+    """
+    Carga artefactos en el índice de forma incremental.
+
+    Cada artefacto se identifica por (origen, maquina, ruta), ya que los
+    inventarios se toman en varias máquinas con las mismas rutas, y guarda una
+    huella de su contenido: si la huella no cambió desde la última carga, no se
+    reescribe.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión devuelta por abrir_indice.
+        origen (str): Inventario de procedencia (pentaho, python, dags).
+        artefactos (iterable): Artefactos producidos por un lector.
+        podar (bool, optional): Si es True, elimina los artefactos del origen
+            que no aparecen en esta carga (inventario completo). Solo se podan
+            las máquinas presentes en la carga.
+
+    Returns:
+        dict: Conteo de artefactos nuevos, actualizados, sin cambios y eliminados.
+    """
+    existentes = {
+        (maquina, ruta): (artefacto_id, huella)
+        for artefacto_id, maquina, ruta, huella in conexion.execute(
+            "SELECT id, maquina, ruta, huella FROM artefactos WHERE origen = ?", (origen,))
+    }
+    conteo = {"nuevos": 0, "actualizados": 0, "sin_cambios": 0, "eliminados": 0}
+    vistos = set()
+    ahora = datetime.now().isoformat(timespec="seconds")
+
+    with conexion:
+        for artefacto in artefactos:
+            referencias = {}
+            for tabla, operacion in artefacto["tablas"]:
+                normalizada = normalizar_tabla(tabla, artefacto["proyecto"])
+                if normalizada:
+                    referencias[(normalizada[0], operacion)] = normalizada
+
+            huella = hashlib.sha1(repr((
+                artefacto["nombre"], artefacto["detalle"], sorted(referencias)
+            )).encode("utf-8")).hexdigest()
+            ruta = artefacto["ruta"]
+            clave = (artefacto["maquina"], ruta)
+            vistos.add(clave)
+
+            anterior = existentes.get(clave)
+            if anterior and anterior[1] == huella:
+                conteo["sin_cambios"] += 1
+                continue
+
+            if anterior:
+                artefacto_id = anterior[0]
+                conexion.execute(
+                    "UPDATE artefactos SET nombre = ?, detalle = ?, huella = ?, actualizado = ? WHERE id = ?",
+                    (artefacto["nombre"], artefacto["detalle"], huella, ahora, artefacto_id))
+                conexion.execute("DELETE FROM referencias WHERE artefacto_id = ?", (artefacto_id,))
+                conexion.execute("DELETE FROM artefactos_fts WHERE rowid = ?", (artefacto_id,))
+                conteo["actualizados"] += 1
+            else:
+                artefacto_id = conexion.execute(
+                    "INSERT INTO artefactos (origen, ruta, nombre, maquina, detalle, huella, actualizado) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (origen, ruta, artefacto["nombre"], artefacto["maquina"], artefacto["detalle"], huella, ahora)
+                ).lastrowid
+                existentes[clave] = (artefacto_id, huella)
+                conteo["nuevos"] += 1
+
+            conexion.executemany(
+                "INSERT INTO referencias (artefacto_id, nombre_normalizado, proyecto, dataset, tabla, operacion) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(artefacto_id, *normalizada, operacion)
+                 for (_, operacion), normalizada in referencias.items()])
+            conexion.execute(
+                "INSERT INTO artefactos_fts (rowid, nombre, ruta, detalle, tablas) VALUES (?, ?, ?, ?, ?)",
+                (artefacto_id, artefacto["nombre"], ruta, artefacto["detalle"],
+                 " ".join(sorted({nombre for nombre, _ in referencias}))))
+
+        if podar:
+            maquinas = {maquina for maquina, _ in vistos}
+            for clave, (artefacto_id, _) in existentes.items():
+                if clave[0] in maquinas and clave not in vistos:
+                    conexion.execute("DELETE FROM artefactos WHERE id = ?", (artefacto_id,))
+                    conexion.execute("DELETE FROM artefactos_fts WHERE rowid = ?", (artefacto_id,))
+                    conteo["eliminados"] += 1
+
+    return conteo
+
+
+def cargar_inventario(conexion, origen, archivo_csv, podar=False, encoding="utf-8"):
+    """
+    Carga el CSV de un inventario en el índice.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión devuelta por abrir_indice.
+        origen (str): Tipo de inventario (pentaho, python, dags).
+        archivo_csv (str): Ruta al CSV generado por el inventario.
+        podar (bool, optional): Eliminar artefactos que ya no están en el CSV.
+        encoding (str, optional): Codificación del CSV.
+
+    Returns:
+        dict: Conteo devuelto por registrar_artefactos.
+    """
+    return registrar_artefactos(conexion, origen, LECTORES[origen](archivo_csv, encoding), podar)
+
+
+def consultar_tabla(conexion, nombre_tabla):
+    """
+    Busca los artefactos que referencian una tabla.
+
+    "tabla" coincide en cualquier dataset, "dataset.tabla" en cualquier proyecto
+    y "proyecto.dataset.tabla" de forma exacta.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión devuelta por abrir_indice.
+        nombre_tabla (str): Tabla a consultar.
+
+    Returns:
+        list: Tuplas (origen, maquina, nombre, ruta, operacion, tabla normalizada).
+    """
+    normalizada = normalizar_tabla(nombre_tabla)
+    if not normalizada:
+        return []
+    _, proyecto, dataset, tabla = normalizada
+
+    condiciones = ["r.tabla = ?"]
+    parametros = [tabla]
+    if dataset:
+        condiciones.append("r.dataset = ?")
+        parametros.append(dataset)
+    if proyecto:
+        condiciones.append("r.proyecto = ?")
+        parametros.append(proyecto)
+
+    return conexion.execute(
+        "SELECT a.origen, a.maquina, a.nombre, a.ruta, r.operacion, r.nombre_normalizado "
+        "FROM referencias r JOIN artefactos a ON a.id = r.artefacto_id "
+        f"WHERE {' AND '.join(condiciones)} ORDER BY a.origen, a.maquina, a.ruta",
+        parametros).fetchall()
+
+
+def consultar_artefacto(conexion, artefacto):
+    """
+    Lista las tablas que referencia un artefacto, buscado por ruta o por nombre.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión devuelta por abrir_indice.
+        artefacto (str): Ruta completa o nombre del artefacto.
+
+    Returns:
+        list: Tuplas (origen, maquina, ruta, tabla normalizada, operacion).
+    """
+    return conexion.execute(
+        "SELECT a.origen, a.maquina, a.ruta, r.nombre_normalizado, r.operacion "
+        "FROM artefactos a JOIN referencias r ON r.artefacto_id = a.id "
+        "WHERE a.id IN (SELECT id FROM artefactos WHERE ruta = ? UNION SELECT id FROM artefactos WHERE nombre = ?) "
+        "ORDER BY a.maquina, a.ruta, r.nombre_normalizado",
+        (artefacto, artefacto)).fetchall()
+
+
+def _frase_fts(texto):
+    # Cada término como frase FTS5, para que ".", "-" o ":" no se interpreten como sintaxis
+    return " ".join('"' + termino.replace('"', '""') + '"' for termino in texto.split())
+
+
+def buscar(conexion, texto, limite=50, sintaxis_fts=False):
+    """
+    Búsqueda de texto completo sobre nombre, ruta, detalle y tablas de los artefactos.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión devuelta por abrir_indice.
+        texto (str): Términos a buscar (por ejemplo: ventas.pedidos proyecto-ventas).
+        limite (int, optional): Máximo de resultados.
+        sintaxis_fts (bool, optional): Si es True, el texto se usa tal cual como
+            consulta FTS5 (por ejemplo: ventas AND pedidos*).
+
+    Returns:
+        list: Tuplas (origen, maquina, nombre, ruta).
+    """
+    if not sintaxis_fts:
+        texto = _frase_fts(texto)
+    if not texto:
+        return []
+    return conexion.execute(
+        "SELECT a.origen, a.maquina, a.nombre, a.ruta FROM artefactos_fts f JOIN artefactos a ON a.id = f.rowid "
+        "WHERE artefactos_fts MATCH ? ORDER BY f.rank LIMIT ?",
+        (texto, limite)).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Índice de linaje: qué jobs, scripts y DAGs referencian cada tabla.")
+    parser.add_argument("--indice", default="indice_linaje.db", help="Archivo SQLite del índice.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    cargar = subparsers.add_parser("cargar", help="Carga el CSV de un inventario.")
+    cargar.add_argument("origen", choices=list(LECTORES))
+    cargar.add_argument("archivo_csv")
+    cargar.add_argument("--podar", action="store_true",
+                        help="Elimina los artefactos del origen que ya no aparecen en el CSV.")
+    cargar.add_argument("--encoding", default="utf-8")
+
+    tabla = subparsers.add_parser("tabla", help="Artefactos que referencian una tabla.")
+    tabla.add_argument("nombre_tabla")
+
+    artefacto = subparsers.add_parser("artefacto", help="Tablas que referencia un artefacto.")
+    artefacto.add_argument("artefacto", help="Ruta completa o nombre del artefacto.")
+
+    busqueda = subparsers.add_parser("buscar", help="Búsqueda de texto completo.")
+    busqueda.add_argument("texto")
+    busqueda.add_argument("--limite", type=int, default=50)
+    busqueda.add_argument("--fts", action="store_true",
+                          help="Interpreta el texto como consulta FTS5 (AND, OR, NOT, prefijo*).")
+
+    args = parser.parse_args(argv)
+    try:
+        conexion = abrir_indice(args.indice)
+    except sqlite3.DatabaseError as e:
+        print(f"Error al abrir el índice {args.indice}: {e}", file=sys.stderr)
+        return 1
+    inicio = time.perf_counter()
+
+    try:
+        if args.comando == "cargar":
+            conteo = cargar_inventario(conexion, args.origen, args.archivo_csv, args.podar, args.encoding)
+            print(f"Inventario {args.origen} cargado en {args.indice}: " +
+                  ", ".join(f"{clave}={valor}" for clave, valor in conteo.items()))
+        else:
+            if args.comando == "tabla":
+                filas = consultar_tabla(conexion, args.nombre_tabla)
+            elif args.comando == "artefacto":
+                filas = consultar_artefacto(conexion, args.artefacto)
+            else:
+                filas = buscar(conexion, args.texto, args.limite, args.fts)
+            escritor = csv.writer(sys.stdout, delimiter=";")
+            escritor.writerows(filas)
+            print(f"{len(filas)} resultados en {(time.perf_counter() - inicio) * 1000:.1f} ms", file=sys.stderr)
+    except sqlite3.OperationalError as e:
+        print(f"Error al consultar el índice {args.indice}: {e}", file=sys.stderr)
+        return 1
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Error al cargar el inventario {args.origen}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conexion.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import os
+import sys
+import importlib.util
+
+import pytest
+
+pytest.importorskip("pendulum")
+pytest.importorskip("pandas")
+
+RAIZ_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RAIZ_REPO, "benchmarks"))
+
+import simuladores  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def inventario_dags():
+    # El módulo crea clientes de GCP al importarse; se carga con los simuladores locales
+    ruta = os.path.join(RAIZ_REPO, "automatizaciones_gcp", "inventario_dags", "inventario_dags.py")
+    with simuladores.simuladores_gcp():
+        spec = importlib.util.spec_from_file_location("inventario_dags", ruta)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+    return modulo
+
+
+def test_extract_no_es_tabla(inventario_dags):
+    lecturas, escrituras = inventario_dags.get_dag_tables(
+        'sql = "SELECT EXTRACT(YEAR FROM t.fecha) FROM ds.tabla t"\n')
+    assert lecturas == ["ds.tabla"]
+    assert escrituras == []
+
+
+def test_comentarios_e_imports_se_ignoran(inventario_dags):
+    contenido = (
+        "from airflow.operators.bash import BashOperator\n"
+        "# updated from config.yaml\n"
+        "x = 1\n")
+    assert inventario_dags.get_dag_tables(contenido) == ([], [])
+
+
+def test_prosa_en_strings_no_es_escritura(inventario_dags):
+    contenido = (
+        'a = "merge data.frames before upload"\n'
+        'b = "update config.json if needed"\n')
+    assert inventario_dags.get_dag_tables(contenido) == ([], [])
+
+
+def test_delete_y_merge_son_escrituras(inventario_dags):
+    contenido = (
+        'a = "DELETE FROM ventas.pedidos WHERE id IN (SELECT id FROM ventas.bajas)"\n'
+        'b = "MERGE ventas.resumen T USING staging.resumen S ON T.id = S.id"\n'
+        'c = "UPDATE `p.ventas.clientes` c SET activo = FALSE"\n')
+    lecturas, escrituras = inventario_dags.get_dag_tables(contenido)
+    assert lecturas == ["staging.resumen", "ventas.bajas"]
+    assert escrituras == ["p.ventas.clientes", "ventas.pedidos", "ventas.resumen"]
+
+
+def test_destination_table(inventario_dags):
+    contenido = "t = BigQueryInsertJobOperator(task_id='x', destination_dataset_table='p.d.t')\n"
+    assert inventario_dags.get_dag_tables(contenido) == ([], ["p.d.t"])